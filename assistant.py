@@ -1,60 +1,273 @@
 import json
 import os
+import queue
 import re
+import tempfile
+import threading
+import uuid
 from datetime import datetime, timedelta
 from calendar import monthrange
+from contextlib import contextmanager
 
-import dateparser  # for natural language date parsing
+try:
+    import orjson  # optional, much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+_dateparser = None  # imported on first use; loading its locale data is slow
 
 TASKS_FILE = "tasks.json"
 
+# Patterns used by the NLP parsers, compiled once at import
+_RE_RECURRENCE_WORD = re.compile(r"every day|daily|every week|weekly|every month|monthly|every year|yearly")
+_RECURRENCE_WORDS = {
+    "every day": "daily", "daily": "daily",
+    "every week": "weekly", "weekly": "weekly",
+    "every month": "monthly", "monthly": "monthly",
+    "every year": "yearly", "yearly": "yearly",
+}
+_RE_EVERY_MIN = re.compile(r"every (\d+)\s*minutes?")
+_RE_EVERY_HR = re.compile(r"every (\d+)\s*hours?")
+_RE_NLP_EVERY_MIN = re.compile(r"every\s+(\d+)\s+minutes?")
+_RE_STRIP = re.compile(
+    r"(remind me to|every.*|daily|weekly|monthly|yearly|tomorrow|today|at \d+(:\d+)?(am|pm)?)",
+    re.IGNORECASE,
+)
+
+# In-memory copy of tasks.json, invalidated by the file's mtime.
+_tasks_cache = None
+_tasks_cache_mtime = None
+_tasks_lock = threading.Lock()
+# Serializes whole load -> mutate -> save sessions across threads (UI flusher,
+# reminder scheduler) so one writer can't save a stale list over another's changes
+_session_lock = threading.RLock()
+# Callables run as hook(tasks, mtime_ns) after every save_tasks()
+_save_hooks = []
+
 # ---------- Storage ----------
+def _dumps(tasks) -> bytes:
+    pretty = bool(os.environ.get("TASKS_PRETTY"))
+    if orjson is not None:
+        return orjson.dumps(tasks, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(tasks, indent=4).encode("utf-8")
+    return json.dumps(tasks, separators=(",", ":")).encode("utf-8")
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def _ensure_store():
     if not os.path.exists(TASKS_FILE):
         with open(TASKS_FILE, "w") as f:
             f.write("[]")
 
+def tasks_mtime():
+    """st_mtime_ns of tasks.json, or None if it does not exist yet."""
+    try:
+        return os.stat(TASKS_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 def load_tasks():
+    """Return the task list, re-reading tasks.json only when it has changed on disk."""
+    return load_tasks_with_mtime()[0]
+
+def load_tasks_with_mtime():
+    """load_tasks(), plus the st_mtime_ns of the tasks.json contents it returned."""
+    global _tasks_cache, _tasks_cache_mtime
     _ensure_store()
-    try:
-        with open(TASKS_FILE, "r") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        return []
+    with _tasks_lock:
+        mtime = os.stat(TASKS_FILE).st_mtime_ns
+        if _tasks_cache is not None and mtime == _tasks_cache_mtime:
+            # Tasks are flat dicts of scalars, so per-task copies keep callers
+            # from mutating the cache without paying for a deepcopy
+            return [dict(t) for t in _tasks_cache], mtime
+        # save_tasks() swaps files with os.replace, so a reader never sees a
+        # half-written file; a decode error means real corruption and is raised.
+        with open(TASKS_FILE, "rb") as f:
+            # Stat the handle we read: the file may be replaced after the stat above
+            mtime = os.fstat(f.fileno()).st_mtime_ns
+            tasks = _loads(f.read())
+        # Lazily migrate tasks saved before due_epoch / id existed
+        for i, task in enumerate(tasks):
+            if "due_epoch" not in task and validate_due_str(task.get("due") or ""):
+                task["due_epoch"] = due_epoch(task["due"])
+            if "id" not in task:
+                # Deterministic, so every process derives the same id until it is saved
+                task["id"] = uuid.uuid5(uuid.NAMESPACE_OID, f"{i}:{task.get('description')}:{task.get('due')}").hex
+        _tasks_cache = tasks
+        _tasks_cache_mtime = mtime
+        return [dict(t) for t in tasks], mtime
 
 def save_tasks(tasks):
-    with open(TASKS_FILE, "w") as f:
-        json.dump(tasks, f, indent=4)
+    global _tasks_cache, _tasks_cache_mtime
+    with _tasks_lock:
+        # Encode once and issue a single write, then swap the file in atomically
+        data = _dumps(tasks)
+        # Unique temp name per writer: _tasks_lock only covers this process, and
+        # the UI and main.py may both save at once
+        fd, tmp = tempfile.mkstemp(
+            prefix=os.path.basename(TASKS_FILE) + ".", suffix=".tmp",
+            dir=os.path.dirname(os.path.abspath(TASKS_FILE)),
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # mkstemp creates the file 0600; keep the store's existing permissions
+            try:
+                os.chmod(tmp, os.stat(TASKS_FILE).st_mode & 0o777)
+            except FileNotFoundError:
+                pass
+            # Taken from our own file: another process may replace tasks.json
+            # right after us, and its mtime must not be paired with our tasks
+            mtime = os.stat(tmp).st_mtime_ns
+            os.replace(tmp, TASKS_FILE)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        # Write-through so the next load_tasks() is served from memory
+        _tasks_cache = [dict(t) for t in tasks]
+        _tasks_cache_mtime = mtime
+    # Outside the lock: hooks may call load_tasks()/save_tasks() themselves
+    for hook in _save_hooks:
+        hook(tasks, mtime)
+
+def register_save_hook(hook):
+    """Call hook(tasks, mtime_ns) after every successful save_tasks() in this process."""
+    if hook not in _save_hooks:
+        _save_hooks.append(hook)
+
+@contextmanager
+def task_session():
+    """Load tasks once, let the caller apply several mutations, and save once on exit.
+
+    Sessions in this process run one at a time, so the list a session saves
+    always includes every change saved before it started.
+    """
+    with _session_lock:
+        tasks = load_tasks()
+        yield tasks
+        save_tasks(tasks)
 
 # ---------- Utilities ----------
-def speak(text: str):
-    """Offline TTS (pyttsx3). Creates its own engine per call for reliability."""
-    try:
+def _get_dateparser():
+    global _dateparser
+    if _dateparser is None:
+        import dateparser
+        _dateparser = dateparser
+    return _dateparser
+
+# Utterances are spoken one at a time by a single background thread that owns the engine
+_tts_queue = queue.Queue()
+_tts_thread = None
+_tts_thread_lock = threading.Lock()
+
+_pyttsx3 = None
+
+def _init_engine():
+    global _pyttsx3
+    if _pyttsx3 is None:
         import pyttsx3
-        engine = pyttsx3.init()
-        voices = engine.getProperty('voices')
-        if len(voices) > 1:
-            engine.setProperty('voice', voices[1].id)
+        _pyttsx3 = pyttsx3
+    engine = _pyttsx3.init()
+    voices = engine.getProperty('voices')
+    if len(voices) > 1:
+        engine.setProperty('voice', voices[1].id)
+    return engine
+
+def _speak_once(text: str):
+    """Old per-call path, used when the shared engine could not be created."""
+    try:
+        engine = _init_engine()
         engine.say(text)
         engine.runAndWait()
     except Exception as e:
         print(f"[speak] Warning: {e}")
 
-def notify(title: str, message: str):
-    """Desktop notification with Windows toast or plyer fallback."""
+def _tts_worker():
+    # pyttsx3 engines must be driven from the thread that created them
+    try:
+        engine = _init_engine()
+    except Exception as e:
+        print(f"[speak] Warning: {e}")
+        engine = None
+
+    while True:
+        text = _tts_queue.get()
+        try:
+            if engine is None:
+                _speak_once(text)
+            else:
+                engine.say(text)
+                engine.runAndWait()
+        except Exception as e:
+            print(f"[speak] Warning: {e}")
+        finally:
+            _tts_queue.task_done()
+
+def _ensure_tts_worker():
+    global _tts_thread
+    with _tts_thread_lock:
+        if _tts_thread is None:
+            _tts_thread = threading.Thread(target=_tts_worker, daemon=True)
+            _tts_thread.start()
+
+def speak(text: str):
+    """Offline TTS (pyttsx3). Queues the text for the speech thread and returns immediately."""
+    _ensure_tts_worker()
+    _tts_queue.put(text)
+
+def flush_speech():
+    """Block until everything passed to speak() has been spoken."""
+    if _tts_thread is not None:
+        _tts_queue.join()
+
+# Notification backends, probed once on the first notify() call. Only the
+# ToastNotifier class is cached: an instance refuses (returns False) to show a
+# new threaded toast while its previous one is still on screen.
+_notify_probed = False
+_toast_cls = None
+_plyer_notification = None
+
+def _probe_notify_backends():
+    global _notify_probed, _toast_cls, _plyer_notification
     try:
         from win10toast import ToastNotifier
-        toaster = ToastNotifier()
-        toaster.show_toast(title, message, duration=5, threaded=True)
-        return
+        _toast_cls = ToastNotifier
     except Exception:
         pass
-
     try:
         from plyer import notification
-        notification.notify(title=title, message=message, timeout=5)
-    except Exception as e:
-        print(f"[notify] {title}: {message} (Notification fallback, {e})")
+        _plyer_notification = notification
+    except Exception:
+        pass
+    _notify_probed = True
+
+def notify(title: str, message: str):
+    """Desktop notification with Windows toast or plyer fallback."""
+    if not _notify_probed:
+        _probe_notify_backends()
+
+    error = "no notification backend available"
+    if _toast_cls is not None:
+        try:
+            if _toast_cls().show_toast(title, message, duration=5, threaded=True) is not False:
+                return
+            error = "toast notifier busy"
+        except Exception as e:
+            error = e
+    if _plyer_notification is not None:
+        try:
+            _plyer_notification.notify(title=title, message=message, timeout=5)
+            return
+        except Exception as e:
+            error = e
+    print(f"[notify] {title}: {message} (Notification fallback, {error})")
 
 # ---------- Date helpers ----------
 def validate_due_str(due_str: str) -> bool:
@@ -64,6 +277,14 @@ def validate_due_str(due_str: str) -> bool:
     except ValueError:
         return False
 
+def due_epoch(due_str: str) -> int:
+    """Minutes since the Unix epoch for a local 'YYYY-MM-DD HH:MM' string."""
+    return int(datetime.strptime(due_str, "%Y-%m-%d %H:%M").timestamp() // 60)
+
+def due_str_from_epoch(epoch: int) -> str:
+    """Inverse of due_epoch(): local 'YYYY-MM-DD HH:MM' for minutes since the Unix epoch."""
+    return datetime.fromtimestamp(epoch * 60).strftime("%Y-%m-%d %H:%M")
+
 def _add_months(dt: datetime, months: int) -> datetime:
     month = dt.month - 1 + months
     year = dt.year + month // 12
@@ -81,41 +302,59 @@ def _add_years(dt: datetime, years: int) -> datetime:
     return datetime(year, dt.month, dt.day, dt.hour, dt.minute)
 
 # ---------- Recurrence + NLP ----------
+def _advance(dt: datetime, recurrence: str, minutes_interval: int = None) -> datetime:
+    if recurrence == "daily":
+        return dt + timedelta(days=1)
+    if recurrence == "weekly":
+        return dt + timedelta(weeks=1)
+    if recurrence == "monthly":
+        return _add_months(dt, 1)
+    if recurrence == "yearly":
+        return _add_years(dt, 1)
+    if recurrence == "every_x_minutes":
+        if not minutes_interval:
+            raise ValueError("minutes_interval must be provided for every_x_minutes recurrence")
+        return dt + timedelta(minutes=minutes_interval)
+    raise ValueError("Invalid recurrence for next_due")
+
 def next_due(due_str: str, recurrence: str, minutes_interval: int = None) -> str:
     dt = datetime.strptime(due_str, "%Y-%m-%d %H:%M")
-    if recurrence == "daily":
-        dt = dt + timedelta(days=1)
-    elif recurrence == "weekly":
-        dt = dt + timedelta(weeks=1)
-    elif recurrence == "monthly":
-        dt = _add_months(dt, 1)
-    elif recurrence == "yearly":
-        dt = _add_years(dt, 1)
-    elif recurrence == "every_x_minutes":
+    return _advance(dt, recurrence, minutes_interval).strftime("%Y-%m-%d %H:%M")
+
+def next_due_epoch(epoch: int, recurrence: str, minutes_interval: int = None) -> int:
+    """Like next_due(), but on due_epoch values.
+
+    Fixed intervals are plain integer additions. Calendar recurrences go through
+    a local datetime so daily/weekly keep their wall-clock time across DST
+    changes and monthly/yearly keep their end-of-month handling.
+    """
+    if recurrence == "every_x_minutes":
         if not minutes_interval:
             raise ValueError("minutes_interval must be provided for every_x_minutes recurrence")
-        dt = dt + timedelta(minutes=minutes_interval)
-    else:
-        raise ValueError("Invalid recurrence for next_due")
-    return dt.strftime("%Y-%m-%d %H:%M")
+        return epoch + minutes_interval
+    dt = _advance(datetime.fromtimestamp(epoch * 60), recurrence, minutes_interval)
+    return int(dt.timestamp() // 60)
+
+def _keyword_recurrence(low: str):
+    """Recurrence named by a keyword in already-lowercased text, daily winning over weekly etc."""
+    found = {_RECURRENCE_WORDS[word] for word in _RE_RECURRENCE_WORD.findall(low)}
+    for recurrence in ("daily", "weekly", "monthly", "yearly"):
+        if recurrence in found:
+            return recurrence
+    return None
 
 def extract_recurrence(text: str):
     """Detect recurrence rules from natural language."""
     text = text.lower()
-    if "every day" in text or "daily" in text:
-        return "daily", None
-    if "every week" in text or "weekly" in text:
-        return "weekly", None
-    if "every month" in text or "monthly" in text:
-        return "monthly", None
-    if "every year" in text or "yearly" in text:
-        return "yearly", None
-
-    m = re.search(r"every (\d+)\s*minutes?", text)
+    recurrence = _keyword_recurrence(text)
+    if recurrence:
+        return recurrence, None
+
+    m = _RE_EVERY_MIN.search(text)
     if m:
         return "every_x_minutes", int(m.group(1))
 
-    m = re.search(r"every (\d+)\s*hours?", text)
+    m = _RE_EVERY_HR.search(text)
     if m:
         return "every_x_minutes", int(m.group(1)) * 60
 
@@ -128,18 +367,13 @@ def parse_task(raw_text: str):
 
     recurrence, minutes_interval = extract_recurrence(raw_text)
 
-    due_dt = dateparser.parse(raw_text, settings={"PREFER_DATES_FROM": "future"})
+    due_dt = _get_dateparser().parse(raw_text, settings={"PREFER_DATES_FROM": "future"})
     if not due_dt:
         raise ValueError("Could not detect a valid due date/time")
 
     due_str = due_dt.strftime("%Y-%m-%d %H:%M")
 
-    desc = re.sub(
-        r"(remind me to|every.*|daily|weekly|monthly|yearly|tomorrow|today|at \d+(:\d+)?(am|pm)?)",
-        "",
-        raw_text,
-        flags=re.IGNORECASE,
-    ).strip()
+    desc = _RE_STRIP.sub("", raw_text).strip()
 
     if not desc:
         desc = raw_text
@@ -147,7 +381,8 @@ def parse_task(raw_text: str):
     return desc, due_str, recurrence, minutes_interval
 
 # ---------- Task Management ----------
-def add_task(description: str, due_str: str, recurrence: str = None, minutes_interval: int = None):
+def make_task(description: str, due_str: str, recurrence: str = None, minutes_interval: int = None) -> dict:
+    """Validate the fields and build a new task dict (with id) without touching tasks.json."""
     if not description.strip():
         raise ValueError("Task description cannot be empty.")
     if not validate_due_str(due_str):
@@ -157,10 +392,11 @@ def add_task(description: str, due_str: str, recurrence: str = None, minutes_int
     if recurrence not in valid_recurrences:
         raise ValueError(f"Recurrence must be one of {valid_recurrences}")
 
-    tasks = load_tasks()
     task_data = {
+        "id": uuid.uuid4().hex,
         "description": description.strip(),
         "due": due_str,
+        "due_epoch": due_epoch(due_str),
         "done": False,
         "recurrence": recurrence
     }
@@ -168,46 +404,88 @@ def add_task(description: str, due_str: str, recurrence: str = None, minutes_int
         if not minutes_interval or minutes_interval <= 0:
             raise ValueError("Minutes interval must be a positive integer for every_x_minutes")
         task_data["minutes_interval"] = minutes_interval
+    return task_data
+
+def _append_task_impl(tasks: list, task: dict):
+    tasks.append(task)
+    recurrence = task.get("recurrence")
+    speak(f"Task added: {task['description']} at {task['due']}{' repeating ' + recurrence if recurrence else ''}")
+    return task
+
+def _add_task_impl(tasks: list, description: str, due_str: str, recurrence: str = None, minutes_interval: int = None):
+    return _append_task_impl(tasks, make_task(description, due_str, recurrence, minutes_interval))
+
+def _task_position(tasks: list, task_id: str) -> int:
+    for i, task in enumerate(tasks):
+        if task.get("id") == task_id:
+            return i
+    raise KeyError(f"No task with id {task_id}")
+
+def _delete_task_impl(tasks: list, task_id: str):
+    removed = tasks.pop(_task_position(tasks, task_id))
+    speak(f"Deleted task {removed.get('description','')}")
+    return removed
+
+def set_task_done(task: dict, done: bool = True) -> str:
+    """Complete/reopen a task dict in place (rescheduling recurring ones) and return what to announce."""
+    recurrence = task.get("recurrence")
+    if done and recurrence:
+        try:
+            if task.get("due_epoch") is not None:
+                task["due_epoch"] = next_due_epoch(task["due_epoch"], recurrence, task.get("minutes_interval"))
+                task["due"] = due_str_from_epoch(task["due_epoch"])
+            else:
+                task["due"] = next_due(task.get("due"), recurrence, task.get("minutes_interval"))
+                task["due_epoch"] = due_epoch(task["due"])
+            task["done"] = False
+            return f"Task rescheduled for {task['due']}"
+        except Exception as e:
+            task["done"] = True
+            return f"Error rescheduling task; marked done. ({e})"
+    task["done"] = done
+    status = "completed" if done else "reopened"
+    return f"Task {status}: {task.get('description','')}"
+
+def _mark_done_impl(tasks: list, task_id: str, done: bool = True):
+    task = tasks[_task_position(tasks, task_id)]
+    speak(set_task_done(task, done))
+    return task
 
-    tasks.append(task_data)
-    save_tasks(tasks)
-    speak(f"Task added: {description} at {due_str}{' repeating ' + recurrence if recurrence else ''}")
-
-def delete_task(index: int):
-    tasks = load_tasks()
-    if 0 <= index < len(tasks):
-        removed = tasks.pop(index)
-        save_tasks(tasks)
-        speak(f"Deleted task {removed.get('description','')}")
-    else:
-        raise IndexError("Task index out of range.")
-
-def mark_done(index: int, done: bool = True):
-    tasks = load_tasks()
-    if 0 <= index < len(tasks):
-        task = tasks[index]
-        recurrence = task.get("recurrence")
-        if done and recurrence:
-            old_due = task.get("due")
+def add_task(description: str, due_str: str, recurrence: str = None, minutes_interval: int = None):
+    """Add a task and return it (including its generated id)."""
+    with task_session() as tasks:
+        return _add_task_impl(tasks, description, due_str, recurrence, minutes_interval)
+
+def delete_task(task_id: str):
+    """Delete a task by id and return the removed task."""
+    with task_session() as tasks:
+        return _delete_task_impl(tasks, task_id)
+
+def mark_done(task_id: str, done: bool = True):
+    """Complete/reopen a task by id; recurring tasks are rescheduled. Returns the task."""
+    with task_session() as tasks:
+        return _mark_done_impl(tasks, task_id, done)
+
+def _append_task_op(tasks: list, task: dict):
+    # A queued batch is applied again if its save fails, so never store the queued dict itself
+    return _append_task_impl(tasks, dict(task))
+
+_TASK_OPS = {
+    "add": _append_task_op,  # takes a dict from make_task()
+    "delete": _delete_task_impl,
+    "mark_done": _mark_done_impl,
+}
+
+def apply_task_ops(ops):
+    """Apply queued (op, *args) mutations in one load/save; ops that fail are reported and skipped."""
+    with task_session() as tasks:
+        for op, *args in ops:
             try:
-                task["due"] = next_due(old_due, recurrence, task.get("minutes_interval"))
-                task["done"] = False
-                speak(f"Task rescheduled for {task['due']}")
+                _TASK_OPS[op](tasks, *args)
             except Exception as e:
-                task["done"] = True
-                speak(f"Error rescheduling task; marked done. ({e})")
-        else:
-            task["done"] = done
-            status = "completed" if done else "reopened"
-            speak(f"Task {status}: {task.get('description','')}")
-        save_tasks(tasks)
-    else:
-        raise IndexError("Task index out of range.")
+                print(f"[tasks] Skipped {op}{tuple(args)}: {e}")
 
 # ---------- NLP Parsing ----------
-import re
-import dateparser
-
 def parse_nlp_task(text: str) -> dict:
     """
     Parse natural language task input into structured task fields.
@@ -218,25 +496,18 @@ def parse_nlp_task(text: str) -> dict:
         raise ValueError("Empty input")
 
     # Extract recurrence keywords
-    recurrence = None
+    low = text.lower()
+    recurrence = _keyword_recurrence(low)
     interval = None
-    if "every day" in text.lower() or "daily" in text.lower():
-        recurrence = "daily"
-    elif "every week" in text.lower() or "weekly" in text.lower():
-        recurrence = "weekly"
-    elif "every month" in text.lower() or "monthly" in text.lower():
-        recurrence = "monthly"
-    elif "every year" in text.lower() or "yearly" in text.lower():
-        recurrence = "yearly"
-    else:
+    if recurrence is None:
         # check pattern: every X minutes
-        match = re.search(r"every\s+(\d+)\s+minutes?", text.lower())
+        match = _RE_NLP_EVERY_MIN.search(low)
         if match:
             recurrence = "every_x_minutes"
             interval = int(match.group(1))
 
     # Parse datetime using robust settings
-    dt = dateparser.parse(
+    dt = _get_dateparser().parse(
         text,
         settings={
             "PREFER_DATES_FROM": "future",
@@ -1,7 +1,7 @@
-# main.py (unchanged)
+# main.py
 import threading
 import time
-from assistant import speak
+from assistant import speak, flush_speech
 from reminder import start_reminders
 
 def main():
@@ -21,6 +21,7 @@ def main():
     except KeyboardInterrupt:
         print("\nShutting down. Bye!")
         speak("Shutting down. Goodbye.")
+        flush_speech()
 
 if __name__ == "__main__":
     main()
@@ -1,69 +1,214 @@
 # reminder.py
+import asyncio
+import bisect
+import sys
+import threading
 import time
-from datetime import datetime
-import schedule
-from assistant import load_tasks, save_tasks, speak, notify, next_due
+import traceback
+from assistant import (
+    load_tasks_with_mtime, task_session, speak, notify, next_due_epoch, due_str_from_epoch,
+    register_save_hook, tasks_mtime,
+)
 
-def _now_minute():
+# uvloop (optional, not available on Windows) gives a faster event loop
+uvloop = None
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+
+# Pending tasks sorted by due time: _due_epochs[k] is the due_epoch of
+# tasks[_due_indices[k]]. Rebuilt when tasks.json changes; _due_epochs[0] is
+# the earliest minute at which anything can fire.
+_due_epochs = []
+_due_indices = []
+_due_mtime = None
+# Guards the index above. Always taken after assistant's session lock, never
+# before it: the save hook (_on_tasks_saved) runs inside task_session().
+_due_lock = threading.RLock()
+# Last minute the scheduler has finished with. Only tasks due after it fire, so
+# reopening or editing a task that is already overdue does not re-announce it.
+_checked_through_epoch = None
+# Event loop running start_reminders_async() and its wake-up event; set on every
+# save so the loop re-checks right away instead of at the next minute
+_loop = None
+_wake = None
+
+def _now_epoch():
     # Compare at minute granularity
-    return datetime.now().strftime("%Y-%m-%d %H:%M")
+    return int(time.time() // 60)
+
+def _rebuild_due_index(tasks, mtime):
+    global _due_epochs, _due_indices, _due_mtime
+    pending = sorted(
+        (task["due_epoch"], i)
+        for i, task in enumerate(tasks)
+        if task.get("due") and task.get("due_epoch") is not None and not task.get("done", False)
+    )
+    _due_epochs = [epoch for epoch, _ in pending]
+    _due_indices = [i for _, i in pending]
+    _due_mtime = mtime
+
+def _refresh_due_index():
+    # Picks up writes from other processes (e.g. the Streamlit UI next to main.py)
+    mtime = tasks_mtime()
+    if mtime == _due_mtime and mtime is not None:
+        return
+    # Tag the index with the mtime of the contents actually read, not a later stat
+    _rebuild_due_index(*load_tasks_with_mtime())
+
+def _on_tasks_saved(tasks, mtime):
+    # Writes from this process hand us the new list, so no re-read is needed
+    with _due_lock:
+        _rebuild_due_index(tasks, mtime)
+    # Saves happen on UI / flusher threads; hand the wake-up to the loop's thread
+    loop = _loop
+    if loop is not None and not loop.is_closed():
+        loop.call_soon_threadsafe(_wake.set)
+
+register_save_hook(_on_tasks_saved)
+
+def _seed_checked_through(now_epoch):
+    # Catch-up policy: at startup only tasks due in the current minute fire;
+    # anything already overdue is left for the user, as before due_epoch existed
+    global _checked_through_epoch
+    _checked_through_epoch = now_epoch - 1
 
 def check_tasks():
-    tasks = load_tasks()
-    now_str = _now_minute()
-    updated = False
+    global _checked_through_epoch
+    with _due_lock:
+        _refresh_due_index()
+        now_epoch = _now_epoch()
+        if _checked_through_epoch is None:
+            _seed_checked_through(now_epoch)
+        lo = bisect.bisect_right(_due_epochs, _checked_through_epoch)
+        if lo == len(_due_epochs) or _due_epochs[lo] > now_epoch:
+            # The current minute stays open: a task added for it later this
+            # minute must still fire
+            _checked_through_epoch = max(_checked_through_epoch, now_epoch - 1)
+            return
+
+    # Lock order is session -> _due_lock (the save hook takes _due_lock while
+    # the session is held), so the session is entered without _due_lock held.
+    with task_session() as tasks:
+        with _due_lock:
+            # Another writer may have saved while we waited for the session
+            _refresh_due_index()
+            fired = _fire_due_tasks(tasks, _checked_through_epoch, now_epoch)
+    # Only advanced once the session has saved, so a failed tick is retried
+    with _due_lock:
+        _checked_through_epoch = max(_checked_through_epoch, now_epoch - 1)
+
+    # Announce only after the save, with no locks held: plyer/toast calls are
+    # synchronous and must not stall the flusher or other writers.
+    for desc in fired:
+        msg = f"Reminder: {desc}"
+        print(f"🔔 {msg}")
+        notify("Task Reminder", msg)
+        speak(msg)
 
-    for task in tasks:
-        due = task.get("due")
-        if not due:  # Skip malformed tasks without due date
+def _fire_due_tasks(tasks, after_epoch, now_epoch):
+    """Update tasks due in (after_epoch, now_epoch] in place; return the descriptions to announce."""
+    fired = []
+
+    # Tasks due in the window are a contiguous slice of the sorted index
+    lo = bisect.bisect_right(_due_epochs, after_epoch)
+    cut = bisect.bisect_right(_due_epochs, now_epoch)
+    due = list(zip(_due_epochs[lo:cut], _due_indices[lo:cut]))
+    del _due_epochs[lo:cut]
+    del _due_indices[lo:cut]
+
+    for task_epoch, i in due:
+        if i >= len(tasks):
+            continue
+        task = tasks[i]
+        # Stale entry (task changed since the index was built)
+        if task.get("done", False) or task.get("due_epoch") != task_epoch:
             continue
 
-        done = task.get("done", False)
         desc = task.get("description", "Untitled task")
         recurrence = task.get("recurrence")  # e.g., 'daily', 'weekly'
         minutes_interval = task.get("minutes_interval", None)  # custom NLP interval
+        fired.append(desc)
 
-        # Trigger reminder if task is due right now
-        if (not done) and (due == now_str):
-            msg = f"Reminder: {desc}"
-            print(f"🔔 {msg}")
-            notify("Task Reminder", msg)
-            speak(msg)
-
-            # Handle recurrence (fixed or NLP custom intervals)
-            if recurrence or minutes_interval:
-                try:
-                    new_due = next_due(due, recurrence, minutes_interval)
-                    if new_due:
-                        task["due"] = new_due
-                        task["done"] = False
-                        print(f"↪ Rescheduled recurring task to {new_due}")
-                    else:
-                        task["done"] = True
-                        print(f"[reminder] Could not compute next due for task: {desc}")
-                except Exception as e:
+        # Handle recurrence (fixed or NLP custom intervals)
+        if recurrence or minutes_interval:
+            try:
+                new_epoch = next_due_epoch(task_epoch, recurrence, minutes_interval)
+                # A late wake-up fires once, then skips the missed occurrences
+                while new_epoch and new_epoch <= now_epoch:
+                    new_epoch = next_due_epoch(new_epoch, recurrence, minutes_interval)
+                if new_epoch:
+                    new_due = due_str_from_epoch(new_epoch)
+                    task["due"] = new_due
+                    task["due_epoch"] = new_epoch
+                    task["done"] = False
+                    k = bisect.bisect_right(_due_epochs, new_epoch)
+                    _due_epochs.insert(k, new_epoch)
+                    _due_indices.insert(k, i)
+                    print(f"↪ Rescheduled recurring task to {new_due}")
+                else:
                     task["done"] = True
-                    print(f"[reminder] Failed to reschedule task: {e}")
-            else:
-                # One-time task
+                    print(f"[reminder] Could not compute next due for task: {desc}")
+            except Exception as e:
                 task["done"] = True
+                print(f"[reminder] Failed to reschedule task: {e}")
+        else:
+            # One-time task
+            task["done"] = True
 
-            updated = True
+    return fired
 
-    if updated:
-        save_tasks(tasks)
+def _safe_check_tasks():
+    # One bad tick (e.g. a corrupt tasks.json, or os.replace refused on Windows)
+    # must not end the scheduler; log it and try again at the next wake-up
+    try:
+        check_tasks()
+    except Exception:
+        print("[reminder] check_tasks failed:")
+        traceback.print_exc()
 
-def start_reminders():
+def _seconds_until_next_minute():
+    return 60 - (time.time() % 60)
+
+async def start_reminders_async():
+    global _loop, _wake
+    # _loop is published last: once it is set, _on_tasks_saved() relies on _wake
+    _wake = asyncio.Event()
+    _loop = asyncio.get_running_loop()
+    with _due_lock:
+        _seed_checked_through(_now_epoch())
     print("⏰ Reminder scheduler started (checks every minute).")
     speak("Reminder scheduler started.")
-    schedule.every(1).minutes.do(check_tasks)
 
     # Also check immediately at startup
-    check_tasks()
+    _safe_check_tasks()
 
+    # Wake at each minute boundary, where due_epoch can change, or as soon as
+    # tasks are saved in this process so a just-added task is not missed.
     while True:
-        schedule.run_pending()
-        time.sleep(1)
+        try:
+            await asyncio.wait_for(_wake.wait(), timeout=_seconds_until_next_minute())
+        except asyncio.TimeoutError:
+            pass
+        _wake.clear()
+        _safe_check_tasks()
+
+def new_event_loop():
+    """Event loop for the scheduler: uvloop's when installed, asyncio's default otherwise."""
+    # Created per loop instead of uvloop.install(), so Streamlit's own loop is left alone
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+def start_reminders():
+    """Blocking entry point (main.py, `python reminder.py`): run the scheduler on its own event loop."""
+    loop = new_event_loop()
+    try:
+        loop.run_until_complete(start_reminders_async())
+    finally:
+        loop.close()
 
 if __name__ == "__main__":
     start_reminders()
@@ -1,31 +1,133 @@
 # ui.py
+import asyncio
+import queue
 import threading
-from datetime import datetime, date, time as dtime
+import time
+import traceback
+from datetime import datetime, timedelta
 
+import pandas as pd
 import streamlit as st
 from assistant import (
-    add_task, load_tasks, delete_task, mark_done, parse_nlp_task
+    make_task, load_tasks, parse_nlp_task, tasks_mtime, set_task_done, apply_task_ops
 )
 import reminder
 
+# Manual-entry recurrence labels -> values accepted by add_task()
+RECURRENCE_MAP = {
+    "None": None,
+    "Daily": "daily",
+    "Weekly": "weekly",
+    "Monthly": "monthly",
+    "Yearly": "yearly",
+    "Every X minutes": "every_x_minutes"
+}
+RECURRENCE_OPTIONS = tuple(RECURRENCE_MAP)
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _cached_load_tasks(mtime_ns):
+    # mtime_ns is only the cache key: writes from the reminder thread or
+    # main.py change it, so they are picked up without an explicit clear()
+    return load_tasks()
+
+# Rows shown per page of the task table
+PAGE_SIZE = 25
+
+# How long the flusher keeps collecting mutations before writing them out
+FLUSH_WINDOW_S = 0.2
+# Wait before retrying a batch that could not be written, doubling up to the max
+FLUSH_RETRY_S = 0.5
+FLUSH_RETRY_MAX_S = 30.0
+
+def _flush_loop(q, status):
+    ops = []
+    retry_s = FLUSH_RETRY_S
+    while True:
+        if not ops:
+            ops.append(q.get())
+        deadline = time.monotonic() + FLUSH_WINDOW_S
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                ops.append(q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            apply_task_ops(ops)
+        except Exception as e:
+            # Nothing was saved (e.g. a corrupt tasks.json, or os.replace refused
+            # on Windows): keep the batch and try it again, with later ops behind it
+            print(f"[flush] Failed to write {len(ops)} task change(s), retrying in {retry_s:g}s: {e}")
+            status["error"] = f"{len(ops)} task change(s) not saved yet: {e}"
+            time.sleep(retry_s)
+            retry_s = min(retry_s * 2, FLUSH_RETRY_MAX_S)
+            continue
+        ops = []
+        retry_s = FLUSH_RETRY_S
+        status["error"] = None
+
+@st.cache_resource
+def _flush_status():
+    # Why the last write failed, or None once the flusher has caught up. Kept in
+    # a resource because script reruns start with fresh module globals.
+    return {"error": None}
+
+@st.cache_resource
+def _flusher():
+    # One writer thread per server process, shared by every session
+    q = queue.Queue()
+    threading.Thread(target=_flush_loop, args=(q, _flush_status()), daemon=True).start()
+    return q
+
+def _enqueue_new_task(task):
+    # Show it in this session right away; the flusher writes it to disk
+    if "tasks" in st.session_state:
+        st.session_state.tasks[task["id"]] = task
+    # Queue a copy: edits made to the session's dict before the flush must
+    # reach disk only through their own queued ops
+    _flusher().put(("add", dict(task)))
+
 st.set_page_config(page_title="Personal Task Assistant", page_icon="📝", layout="centered")
 st.title("📝 Personal Task Assistant")
 
-# --- Start / status of reminders (per-session thread) ---
-if "reminder_thread_started" not in st.session_state:
-    st.session_state.reminder_thread_started = False
+# --- Start / status of reminders (one thread per server process) ---
+@st.cache_resource
+def _scheduler_singleton():
+    # cache_resource runs this once and shares the loop with every session
+    loop = reminder.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    fut = asyncio.run_coroutine_threadsafe(reminder.start_reminders_async(), loop)
 
-def start_scheduler_bg():
-    if not st.session_state.reminder_thread_started:
-        t = threading.Thread(target=reminder.start_reminders, daemon=True)
-        t.start()
-        st.session_state.reminder_thread_started = True
+    def _on_exit(fut):
+        # Nobody awaits this future, so report the failure here and let the
+        # next Start press build a fresh scheduler instead of the dead one
+        if fut.cancelled():
+            print("[scheduler] Reminder scheduler was cancelled.")
+        elif fut.exception() is not None:
+            exc = fut.exception()
+            print("[scheduler] Reminder scheduler stopped:")
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+        _scheduler_singleton.clear()
+        loop.call_soon_threadsafe(loop.stop)
+
+    fut.add_done_callback(_on_exit)
+    return fut
 
 with st.sidebar:
     st.header("⚙️ Controls")
     if st.button("▶ Start Reminder Scheduler"):
-        start_scheduler_bg()
-        st.success("Reminder scheduler started in the background for this session.")
+        st.session_state.scheduler_future = _scheduler_singleton()
+
+    scheduler_future = st.session_state.get("scheduler_future")
+    if scheduler_future is None:
+        st.caption("Reminder scheduler not started from this session.")
+    elif scheduler_future.done():
+        st.error("Reminder scheduler stopped (see the server log). Press Start to restart it.")
+    else:
+        st.success("Reminder scheduler is running in the background.")
+
+    flush_error = _flush_status()["error"]
+    if flush_error:
+        st.error(f"Could not save tasks: {flush_error}. Retrying in the background (see the server log).")
 
     st.markdown("---")
     st.caption("Keep this page open if you rely on the scheduler here. "
@@ -53,7 +155,8 @@ if st.button("Add via NLP"):
                 recurrence = parsed.get("recurrence", None)
                 interval = parsed.get("minutes_interval", None)
 
-                add_task(desc, due_str, recurrence, interval)
+                # make_task validates up front, so bad input never reaches the flusher
+                _enqueue_new_task(make_task(desc, due_str, recurrence, interval))
                 st.success(f"✅ Added: {desc} @ {due_str or 'N/A'} ({recurrence or 'None'})")
 
             # Debug view for dev/testing
@@ -64,13 +167,15 @@ if st.button("Add via NLP"):
 
 # --- Add Task (Option 2: Manual Form) ---
 st.subheader("➕ Add a New Task (Manual Entry)")
-col1, col2 = st.columns(2)
+# Default to the next minute; timedelta rolls hour and date over correctly
+_default_due = datetime.now() + timedelta(minutes=1)
+c1, c2, c3 = st.columns([2, 1, 1])
 
-with col1:
+with c1:
     desc = st.text_input("Task description", placeholder="e.g., Finish report")
     recurrence_choice = st.selectbox(
         "Recurrence",
-        options=["None", "Daily", "Weekly", "Monthly", "Yearly", "Every X minutes"],
+        options=RECURRENCE_OPTIONS,
         index=0
     )
     minutes_interval = None
@@ -79,60 +184,127 @@ with col1:
             "Interval (minutes)", min_value=1, max_value=1440, value=5
         )
 
-with col2:
-    due_date = st.date_input("Due date", value=date.today())
+with c2:
+    due_date = st.date_input("Due date", value=_default_due.date())
+
+with c3:
     due_time = st.time_input(
         "Due time (HH:MM)",
-        value=dtime(
-            hour=datetime.now().hour,
-            minute=(datetime.now().minute + 1) % 60
-        )
+        value=_default_due.time().replace(second=0, microsecond=0)
     )
 
 if st.button("Add via Form"):
     if not desc.strip():
         st.warning("Please enter a task description.")
     else:
-        recurrence_map = {
-            "None": None,
-            "Daily": "daily",
-            "Weekly": "weekly",
-            "Monthly": "monthly",
-            "Yearly": "yearly",
-            "Every X minutes": "every_x_minutes"
-        }
-        recurrence = recurrence_map.get(recurrence_choice, None)
-        due_str = f"{due_date.strftime('%Y-%m-%d')} {due_time.strftime('%H:%M')}"
+        recurrence = RECURRENCE_MAP.get(recurrence_choice, None)
+        due_str = (
+            f"{due_date.year:04d}-{due_date.month:02d}-{due_date.day:02d} "
+            f"{due_time.hour:02d}:{due_time.minute:02d}"
+        )
         try:
-            add_task(desc, due_str, recurrence, minutes_interval)
-            st.success(f"✅ Added: {desc} @ {due_str} ({recurrence_choice})")
-        except Exception as e:
+            task = make_task(desc, due_str, recurrence, minutes_interval)
+        except ValueError as e:
             st.error(str(e))
+        else:
+            _enqueue_new_task(task)
+            st.success(f"✅ Added: {desc} @ {due_str} ({recurrence_choice})")
 
 # --- Task List ---
-st.subheader("📋 Tasks")
-tasks = load_tasks()
-if not tasks:
-    st.info("No tasks yet. Add your first one above!")
-else:
-    for i, task in enumerate(tasks):
-        c1, c2, c3, c4 = st.columns([6, 3, 1.4, 1.4])
-        with c1:
-            st.write(f"**{i+1}. {task.get('description','')}**")
-            rec = task.get("recurrence")
-            rec_label = rec.capitalize() if rec else "None"
-            st.caption(f"Due: {task.get('due','N/A')} — Recurrence: {rec_label}")
-        with c2:
-            done_flag = task.get("done", False)
-            st.write("✅ Done" if done_flag else "⏳ Pending")
-        with c3:
-            if st.button("Toggle", key=f"toggle_{i}"):
-                mark_done(i, not task.get("done", False))
-                st.rerun()
-        with c4:
-            if st.button("🗑️ Delete", key=f"delete_{i}"):
-                delete_task(i)
-                st.rerun()
+def _tasks_frame(tasks):
+    # Rows are indexed by task id, not list position
+    return pd.DataFrame(
+        index=pd.Index([t["id"] for t in tasks], name="id"),
+        data={
+            "description": [t.get("description", "") for t in tasks],
+            "due": [t.get("due", "N/A") for t in tasks],
+            "recurrence": [(t.get("recurrence") or "none").capitalize() for t in tasks],
+            "done": [bool(t.get("done", False)) for t in tasks],
+            "delete": [False] * len(tasks),
+        }
+    )
+
+def _tasks_table(tasks):
+    """DataFrame for the table, rebuilt only when a displayed field changed."""
+    h = hash(tuple(
+        (t["id"], t.get("done", False), t.get("description"), t.get("due"), t.get("recurrence"))
+        for t in tasks
+    ))
+    if st.session_state.get("_tasks_hash") != h:
+        st.session_state._tasks_frame = _tasks_frame(tasks)
+        st.session_state._tasks_hash = h
+    return st.session_state._tasks_frame
+
+def _session_tasks():
+    """This session's tasks as {id: task}, re-read only when tasks.json was written elsewhere."""
+    mtime = tasks_mtime()
+    if "tasks" not in st.session_state or st.session_state.tasks_mtime != mtime:
+        st.session_state.tasks = {t["id"]: t for t in _cached_load_tasks(mtime)}
+        st.session_state.tasks_mtime = mtime
+    return st.session_state.tasks
+
+def _apply_task_edits(editor_key):
+    """on_change for the task table: apply only the rows the user touched."""
+    edited_rows = st.session_state[editor_key]["edited_rows"]
+    # edited_rows is keyed by row position; map back to the ids rendered
+    row_ids = st.session_state.tasks_editor_ids
+    store = st.session_state.tasks
+    flusher = _flusher()
+    for row, changes in edited_rows.items():
+        task_id = row_ids[int(row)]
+        # Update this session's copy now; the flusher applies the same change on disk
+        if changes.get("delete"):
+            store.pop(task_id, None)
+            flusher.put(("delete", task_id))
+        elif "done" in changes:
+            set_task_done(store[task_id], changes["done"])
+            flusher.put(("mark_done", task_id, changes["done"]))
+
+    # Fresh editor state for the new data
+    st.session_state.tasks_editor_version += 1
+
+# Rendered as a fragment: edits rerun only this block, not the whole page
+@st.fragment
+def _task_list_fragment():
+    st.subheader("📋 Tasks")
+    store = _session_tasks()
+    if not store:
+        st.info("No tasks yet. Add your first one above!")
+        return
+
+    # Only one page of rows is sent to the browser, however long the list gets
+    tasks = list(store.values())
+    pages = (len(tasks) + PAGE_SIZE - 1) // PAGE_SIZE
+    page = 1
+    if pages > 1:
+        # Clamp before the widget is created, e.g. after deleting the last page's rows
+        st.session_state.tasks_page = min(st.session_state.get("tasks_page", 1), pages)
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, key="tasks_page")
+    visible = tasks[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+    st.session_state.tasks_editor_ids = [t["id"] for t in visible]
+
+    # One table for the whole list instead of a row of widgets per task
+    st.session_state.setdefault("tasks_editor_version", 0)
+    editor_key = f"tasks_editor_{st.session_state.tasks_editor_version}"
+    st.data_editor(
+        _tasks_table(visible),
+        key=editor_key,
+        on_change=_apply_task_edits,
+        args=(editor_key,),
+        hide_index=True,
+        use_container_width=True,
+        num_rows="fixed",
+        disabled=("description", "due", "recurrence"),
+        column_config={
+            "description": st.column_config.TextColumn("Task", width="large"),
+            "due": st.column_config.TextColumn("Due"),
+            "recurrence": st.column_config.TextColumn("Recurrence"),
+            "done": st.column_config.CheckboxColumn("Done"),
+            "delete": st.column_config.CheckboxColumn("🗑️ Delete"),
+        },
+    )
+
+_task_list_fragment()
 
 st.markdown("---")
 st.caption("Tip: Try adding tasks in natural language (e.g., 'Submit assignment next Monday 9am, repeat weekly').")